@@ -4,14 +4,12 @@ Main entry point for running the Game of Life.
 """
 
 import sys
-import argparse
 import curses
 from functools import partial
 
 from game_of_life.gol import play
 from game_of_life.menu import preset_menu, refresh_rate_menu
 from game_of_life.constants import DEFAULTS
-from game_of_life.validate import valid_refresh_rate_string, valid_preset_id_string
 
 
 def main() -> None:
@@ -30,10 +28,13 @@ def main() -> None:
                                refresh_rate=_refresh_rate)
         curses.wrapper(partial_main)
     else:
-        # Arguments were passed
+        # Arguments were passed. argparse is only needed on this path.
+        # pylint: disable=import-outside-toplevel
+        import argparse
+        from game_of_life.validate import valid_refresh_rate_string, valid_preset_id_string
         parser = argparse.ArgumentParser(
             description="Conway's Game of Life.",
-            epilog="Ctrl + C to quit.",
+            epilog="Press q to quit.",
             formatter_class=argparse.ArgumentDefaultsHelpFormatter)
         parser.add_argument('-p', '--preset', type=valid_preset_id_string,
                             default=DEFAULTS.preset,
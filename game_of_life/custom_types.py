@@ -1,6 +1,6 @@
 """Type definitions for type hints."""
 
-from typing import NamedTuple
+from typing import NamedTuple, TypeAlias
 
 
 class Point(NamedTuple):
@@ -13,6 +13,11 @@ class Point(NamedTuple):
     x: int
 
 
+# Coordinates (y, x) of a cell. Unlike Point, a plain tuple is cheap to
+# create, so it is used for cells in the game loop.
+Cell: TypeAlias = tuple[int, int]
+
+
 class Size(NamedTuple):
     """Grid size.
 
@@ -28,7 +33,7 @@ class Preset(NamedTuple):
 
     idx: int
     name: str
-    cells: set[Point]
+    cells: frozenset[Cell]
 
 
 class Defaults(NamedTuple):
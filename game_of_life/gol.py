@@ -1,57 +1,76 @@
 """The Game of Life."""
 
 import curses
-from typing import Generator, Type
+from collections import Counter, deque
+from functools import cache
+from math import ceil
+from typing import Final, Iterable
 from time import perf_counter
 
 from game_of_life.custom_types import (
-    Point,
+    Cell,
     Size,
     Preset)
 from game_of_life.constants import (
     PRESETS,
+    PRESET_COUNT,
     random_preset,
-    DEFAULTS)
+    DEFAULTS,
+    PACKED_MIN_DENSITY)
 
 
-class Universe:
-    """Singleton class for Universe.
+# Keys that quit the game.
+QUIT_KEYS: Final[frozenset[int]] = frozenset(map(ord, 'qQ'))
 
-    The Game of Life occurs within the context of a single 'Universe'.
-    This class manages persistent state of the Universe.
-    """
+# Longest period of oscillator that is detected and replayed, rather than
+# recalculated. (Penta-decathlon has a period of 15.)
+MAX_PERIOD: Final[int] = 15
 
-    _instance = None
-    _initialized = False
+# Positions of the set bits in each byte value.
+BYTE_BITS: Final[tuple[tuple[int, ...], ...]] = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+# Rows with more live cells than this are unpacked a byte at a time.
+LUT_MIN_CELLS: Final[int] = 8
 
-    def __new__(cls: Type['Universe'], *args, **kwargs) -> 'Universe':
-        """Override the creation of new instances for the Singleton pattern.
+# (y, x) offsets from a cell to each of its neighbours.
+NEIGHBOUR_OFFSETS: Final[tuple[tuple[int, int], ...]] = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1))
 
-        Enforces the Singleton pattern by allowing only one instance of the
-        Universe class to exist at any time.
+# The sparse update packs cell coordinates into a single integer key,
+# (y << KEY_SHIFT) + x, which is faster to hash than a tuple. x must be
+# in the range +/- 2**(KEY_SHIFT - 1).
+KEY_SHIFT: Final[int] = 32
+# NEIGHBOUR_OFFSETS as key offsets.
+NEIGHBOUR_KEY_OFFSETS: Final[tuple[int, ...]] = tuple(
+    (dy << KEY_SHIFT) + dx for dy, dx in NEIGHBOUR_OFFSETS)
 
-        Arguments
-        ---------
-            cls : Type['Universe']
-                The class itself.
 
-        Returns
-        -------
-        'Universe'
-            The created instance or the existing instance if it already exists.
-        """
-        if not cls._instance:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+class Universe:
+    """Class for Universe.
+
+    The Game of Life occurs within the context of a 'Universe'.
+    This class manages persistent state of the Universe.
+    """
+
+    __slots__ = ('display_size', '_refresh_rate', 'live_cells', '_history', '_cycle',
+                 '_phase')
 
     def __init__(self) -> None:
         """Initialize an empty Universe."""
-        if not Universe._initialized:
-            self.display_size = DEFAULTS.universe_size
-            self._refresh_rate = DEFAULTS.refresh_rate
-            # Universe initialised without any cells.
-            self.live_cells: set[Point] = set()
-            Universe._initialized = True
+        self.display_size = DEFAULTS.universe_size
+        self._refresh_rate = DEFAULTS.refresh_rate
+        # Universe initialised without any cells.
+        self.live_cells: set[Cell] = set()
+        # Population of recent generations, oldest first, each with a snapshot
+        # of the generation if it may be part of a cycle.
+        self._history: deque[tuple[int, frozenset[Cell] | None]] = deque(
+            maxlen=MAX_PERIOD)
+        # Snapshots of the generations of a detected cycle, in order.
+        self._cycle: list[frozenset[Cell]] = []
+        # Index in _cycle of the current generation.
+        self._phase: int = 0
 
     @property
     def refresh_rate(self):
@@ -72,9 +91,9 @@ class Universe:
 
         """
         preset = get_one_preset(choice)
-        self.live_cells = set(cell for cell in preset.cells)
+        self.live_cells = set(preset.cells)
 
-    def update(self) -> set[Point]:
+    def update(self) -> set[Cell]:
         """Update the Universe state according to the rules of Conway's Game of Life.
 
         Calculate and return the next generation of live cells based on the current
@@ -82,55 +101,99 @@ class Universe:
 
         Returns
         -------
-        set[Point]
-            A set containing the new live cells that satisfy the rules and are
-            within the display range.
+        set[Cell]
+            A set containing the new live cells that satisfy the rules.
+
+        See Also
+        --------
+        next_generation : Calculates the next generation.
 
         Notes
         -----
-        The method considers the current live cells and their neighboring cells.
-        It then calculates the number of live neighbors for each cell and applies
-        the rules of the game to determine if the cell should be alive in the next
+        When a generation is the same as one up to `MAX_PERIOD` generations
+        before, the pattern is a still life or oscillator and will repeat
+        forever. The generations of the cycle are then replayed without being
+        recalculated, for as long as `live_cells` matches the expected
         generation.
 
-        - If a cell has 3 live neighbors, it will be alive in the next generation,
-          regardless of its current state.
-        - If a cell has 2 live neighbors, and it is currently alive, it will continue
-          to be alive in the next generation.
-
-        The set containing the new live cells for the next generation is returned.
+        A generation can only repeat an earlier one of the same population,
+        so a snapshot is only kept when the population has occurred within the
+        last `MAX_PERIOD` generations. A cycle is therefore found on its second
+        time round. As `live_cells` may be replaced or modified in place between
+        updates, a match is only a candidate, and the cycle is confirmed by
+        stepping through it once from the snapshot.
         """
-        new_cells = set()
-        # We only need to consider cells that are either alive
-        # or neighbouring a live cell.
-        cell_set = set(self.live_cells)
-        for cell in self.live_cells:
-            cell_set.update(neighbours(cell))
-        # Return the next generation.
-        for cell in cell_set:
-            n_cells = neighbours(cell)
-            live_count = sum(1 for neighbor in n_cells if neighbor in self.live_cells)
-            if live_count == 3 or (live_count == 2 and cell in self.live_cells):
-                new_cells.add(cell)
+        live_cells = self.live_cells
+        cycle = self._cycle
+        if cycle:
+            if live_cells == cycle[self._phase]:
+                self._phase = (self._phase + 1) % len(cycle)
+                return set(cycle[self._phase])
+            # live_cells was changed from outside, so the cycle is broken.
+            self._cycle = []
+        new_cells = next_generation(live_cells)
+        population = len(new_cells)
+        history = self._history
+        candidates = [(period, snapshot)
+                      for period, (size, snapshot) in enumerate(reversed(history), 1)
+                      if size == population]
+        for period, snapshot in candidates:
+            if snapshot == new_cells and self._start_cycle(snapshot, period):
+                return new_cells
+        history.append((population, frozenset(new_cells) if candidates else None))
         return new_cells
 
+    def _start_cycle(self, start: frozenset[Cell], period: int) -> bool:
+        """Start replaying the cycle from `start`, if it repeats every `period` generations.
+
+        Parameters
+        ----------
+        start : frozenset[Cell]
+            The generation that may begin the cycle.
+        period : int
+            The number of generations in the cycle.
 
-class GameOfLifeUI:
+        Returns
+        -------
+        bool
+            True if the cycle was confirmed.
+        """
+        cycle = [start]
+        cells = set(start)
+        for _ in range(period - 1):
+            cells = next_generation(cells)
+            cycle.append(frozenset(cells))
+        if next_generation(cells) != start:
+            return False
+        self._cycle = cycle
+        self._phase = 0
+        return True
+
+
+class GameOfLifeUI:  # pylint: disable=too-many-instance-attributes
     """Render GOL to terminal."""
 
-    def __init__(self) -> None:
+    def __init__(self, universe: Universe) -> None:
         """Initialize the GameOfLifeUI class.
 
         GameOfLifeUI handles graphic display of game.
+
+        Parameters
+        ----------
+        universe : Universe
+            The Universe to display.
         """
-        self._universe = Universe()  # Singleton instance
+        self._universe = universe
         self._pad_size = self._universe.display_size
         height, width = self._pad_size
         self._pad: 'curses._CursesWindow' = curses.newpad(height, width)
         self._cell_char = ' '
         self._refresh_rate = self._universe.refresh_rate
         self._population: int = 0
-        self._clock = perf_counter()
+        # Time (perf_counter) at which the next frame is due.
+        self._next_frame = perf_counter() + self._refresh_rate
+        # Population and terminal size last written to the info line.
+        self._info: tuple[int, int, int] | None = None
 
     @property
     def pad_size(self) -> Size:
@@ -149,13 +212,14 @@ class GameOfLifeUI:
         """
         return self._pad_size
 
-    def populate(self, live_cells: set[Point]) -> None:
+    def populate(self, live_cells: set[Cell]) -> None:
         """Populate the pad with live cells.
 
         Parameters
         ----------
-        live_cells : set[Point]
-            A set containing the coordinates of live cells.
+        live_cells : set[Cell]
+            A set containing the coordinates of cells that have become live.
+            Cells that are already displayed need not be included.
 
         Raises
         ------
@@ -164,107 +228,349 @@ class GameOfLifeUI:
             Such errors are expected and must pass silently.
 
         """
-        self._population = len(live_cells)
-        for y, x in live_cells:
-            # Adding characters outside the available window area raises a curses.error.
-            try:
-                self._pad.addch(y, x, self._cell_char, curses.A_REVERSE)
-            except curses.error:
-                pass
+        self._population += len(live_cells)
+        self._draw_cells(live_cells, curses.A_REVERSE)
 
     def write_info(self) -> None:
-        """Write info to top line of pad."""
-        # Ensure that we have the current terminal size.
-        curses.update_lines_cols()
-        window_info: str = f' Height: {curses.LINES} Width: {curses.COLS} '
-        window_info_pos = min(curses.COLS, self.pad_size.x) - len(window_info)
-        # Clear top line
-        self._pad.addstr(0, 0, self._cell_char * curses.COLS)
-        # Add info to top line of pad.
-        self._pad.addstr(0, 0, f'Population: {self._population} ', curses.A_REVERSE)
-        self._pad.addstr(0, window_info_pos, window_info, curses.A_REVERSE)
+        """Write info to top line of pad.
 
-    def refresh_pad(self) -> None:
-        """Refresh the Curses pad.
+        The terminal size is updated by `wait_for_frame` when the terminal
+        is resized. The line is only rewritten when the population or
+        terminal size has changed.
+        """
+        info = (self._population, curses.LINES, curses.COLS)
+        if info == self._info:
+            return
+        self._info = info
+        width = self.pad_size.x
+        population = f'Population: {self._population} '
+        window_info = f' Height: {curses.LINES} Width: {curses.COLS} '
+        # Window info is right aligned to the visible part of the pad.
+        visible_width = min(curses.COLS, width)
+        line = population + window_info.rjust(visible_width - len(population))
+        # Write the whole line at once, so that it also clears the old info.
+        self._pad.addstr(0, 0, line.ljust(width)[:width], curses.A_REVERSE)
+
+    def wait_for_frame(self, window: curses.window) -> bool:
+        """Wait until the next frame is due, while listening for the quit key.
+
+        If the next frame is ready before it is due, the method will wait to
+        achieve the desired frame rate. The wait is a `getch` with a timeout,
+        so key presses are read without a separate input loop.
 
-        The pad is refreshed at a controlled rate based on the `refresh_rate` attribute.
-        If the elapsed time since the last refresh is less than the `refresh_rate`,
-        the method will wait to achieve the desired frame rate.
-        The pad's refresh area is adjusted to fit the visible window.
+        Parameters
+        ----------
+        window : curses.window
+            The window to read keys from.
+
+        Returns
+        -------
+        bool
+            True if a quit key was pressed, otherwise False.
 
         Notes
         -----
-        - Sleep time is calculated to maintain the desired frame rate.
-        - The pad's refresh area is limited to fit within the terminal window.
+        - curses reports a terminal resize as a key, so the terminal size
+          is only updated when it changes, rather than every frame.
+        - Frames are due at regular intervals from an absolute deadline, so
+          pacing does not drift by the time taken to calculate each frame.
+        - If a frame is late, the following frame is due `refresh_rate` after it,
+          rather than trying to catch up. Pending keys are still read.
+        """
+        now = perf_counter()
+        deadline = max(now, self._next_frame)
+        self._next_frame = deadline + self._refresh_rate
+        while True:
+            window.timeout(ceil(max(deadline - now, 0) * 1000))
+            key = window.getch()
+            if key in QUIT_KEYS:
+                return True
+            if key == curses.ERR:
+                # Timed out, so the frame is due.
+                return False
+            if key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+            now = perf_counter()
+
+    def refresh_pad(self) -> None:
+        """Refresh the Curses pad.
+
+        The pad's refresh area is limited to fit within the terminal window.
         """
-        # Wait if less than refresh_rate (seconds) since previous refresh.
-        time_since_last_refresh = perf_counter() - self._clock
-        if time_since_last_refresh < self._refresh_rate:
-            sleep_time = int((self._refresh_rate - time_since_last_refresh) * 1000)
-            curses.napms(sleep_time)
-        # Now refresh the area of the pad that will fit in terminal window.
         y_max = min(curses.LINES - 1, self.pad_size.y)
         x_max = min(curses.COLS - 1, self.pad_size.x)
         self._pad.refresh(0, 0, 0, 0, y_max, x_max)
-        self._clock = perf_counter()
-
-    def clear_cells(self, cells: set[Point]) -> None:
-        """Clear the cells on the pad."""
-        for y, x in cells:
-            try:
-                self._pad.addch(y, x, self._cell_char)
-            except curses.error:
-                # addch to bottom right corner throws a curses error
-                pass
 
+    def clear_cells(self, cells: set[Cell]) -> None:
+        """Clear the cells on the pad.
 
-def neighbours(point: Point) -> Generator[Point, None, None]:
-    """Yield each coordinate around point.
+        Parameters
+        ----------
+        cells : set[Cell]
+            A set containing the coordinates of cells that have died.
+        """
+        self._population -= len(cells)
+        self._draw_cells(cells, curses.A_NORMAL)
 
-    Each neighbouring cell is yielded in turn.
+    def _draw_cells(self, cells: set[Cell], attr: int) -> None:
+        """Draw cells on the pad with the specified attribute.
 
-    Arguments
-    ---------
-    point : Point
-        Coordinates (y, x) of the cell being evaluated.
+        The pad only ever holds `_cell_char`, so a cell is drawn by changing
+        its attribute. Each horizontal run of adjacent cells is drawn with a
+        single `chgat`, rather than one `addch` per cell.
 
-    Yields
-    ------
-    Point
-        The neighboring cell coordinates.
+        Parameters
+        ----------
+        cells : set[Cell]
+            A set containing the coordinates of the cells to draw.
+        attr : int
+            Curses attribute for the cells.
+        """
+        height, width = self._pad_size
+        chgat = self._pad.chgat
+        for y, x, length in horizontal_runs(cells):
+            # Clip the run to the pad, below the info line. Unlike `addstr`,
+            # `chgat` does not advance the cursor, so the bottom right corner
+            # is safe.
+            if not 0 < y < height:
+                continue
+            x_end = x + length
+            if 0 <= x and x_end <= width:
+                chgat(y, x, length, attr)
+                continue
+            x, x_end = max(x, 0), min(x_end, width)
+            if x < x_end:
+                chgat(y, x, x_end - x, attr)
+
+
+def next_generation(live_cells: set[Cell]) -> set[Cell]:
+    """Return the next generation according to the rules of Conway's Game of Life.
+
+    Parameters
+    ----------
+    live_cells : set[Cell]
+        The live cells of the current generation.
+
+    Returns
+    -------
+    set[Cell]
+        A set containing the new live cells that satisfy the rules.
+
+    Notes
+    -----
+    Two implementations of the rules are available:
+
+    - `next_generation_packed` packs the Universe into a single integer and
+      counts neighbours for every cell at once with bitwise operations.
+    - `next_generation_sparse` counts the neighbours of each live cell
+      individually.
+
+    The packed update is much faster for any practical pattern, but its cost
+    grows with the area of the bounding box around the live cells. The sparse
+    update is used when the live cells are very widely spread out, (for
+    example, when gliders have travelled a long way from the rest of the
+    population).
+
+    - If a cell has 3 live neighbors, it will be alive in the next generation,
+      regardless of its current state.
+    - If a cell has 2 live neighbors, and it is currently alive, it will continue
+      to be alive in the next generation.
+
+    The set containing the new live cells for the next generation is returned.
     """
-    y = point[0]
-    x = point[1]
-    yield Point(y - 1, x - 1)
-    yield Point(y, x - 1)
-    yield Point(y + 1, x - 1)
-    yield Point(y - 1, x)
-    yield Point(y + 1, x)
-    yield Point(y - 1, x + 1)
-    yield Point(y, x + 1)
-    yield Point(y + 1, x + 1)
+    if not live_cells:
+        return set()
+    # Bounding box of the live cells.
+    ys, xs = zip(*live_cells)
+    y_min, y_max = min(ys), max(ys)
+    x_min, x_max = min(xs), max(xs)
+    area = (y_max - y_min + 1) * (x_max - x_min + 1)
+    if len(live_cells) < area * PACKED_MIN_DENSITY:
+        return next_generation_sparse(live_cells)
+    return next_generation_packed(live_cells, y_min, y_max, x_min, x_max)
+
+
+def next_generation_sparse(live_cells: set[Cell]) -> set[Cell]:
+    """Return the next generation by counting neighbours of each live cell.
+
+    Parameters
+    ----------
+    live_cells : set[Cell]
+        The live cells of the current generation.
+
+    Notes
+    -----
+    The update is done in two phases, like a convolution of the grid with a
+    3x3 kernel:
+
+    - Sum phase: Each live cell adds one to the neighbour count of each of
+      its eight neighbours. Cells that are not counted have no live
+      neighbours, so cannot be alive in the next generation.
+    - Update phase: The rules of the game are applied to each counted cell.
+
+    Cells are counted by integer keys rather than (y, x) tuples. See KEY_SHIFT.
+    """
+    live_keys = {(y << KEY_SHIFT) + x for y, x in live_cells}
+    # Sum phase.
+    counts = Counter(key + offset for key in live_keys
+                     for offset in NEIGHBOUR_KEY_OFFSETS)
+    # Update phase.
+    new_cells = set()
+    half = 1 << (KEY_SHIFT - 1)
+    for key, count in counts.items():
+        if count == 3 or (count == 2 and key in live_keys):
+            # Round y, so that negative x unpacks correctly.
+            y = (key + half) >> KEY_SHIFT
+            new_cells.add((y, key - (y << KEY_SHIFT)))
+    return new_cells
+
+
+def next_generation_packed(  # pylint: disable=too-many-locals,too-many-nested-blocks
+        live_cells: set[Cell], y_min: int, y_max: int, x_min: int, x_max: int
+) -> set[Cell]:
+    """Return the next generation by counting neighbours of the whole grid at once.
+
+    Parameters
+    ----------
+    live_cells : set[Cell]
+        The live cells of the current generation.
+    y_min, y_max : int
+        First and last rows containing live cells.
+    x_min, x_max : int
+        First and last columns containing live cells.
+
+    Notes
+    -----
+    The bounding box of the live cells, plus a margin of one cell where new
+    cells may be born, is packed into a single integer. Each row takes
+    `row_bytes` bytes, with bit `n` of a row representing the cell in column
+    `x_min - 1 + n`. The margin columns are empty, so the cells at the end
+    of one row and the start of the next do not count each other.
+
+    Shifting the grid by one bit lines up each cell with its left or right
+    neighbour, and shifting by one row lines up each cell with the cells
+    above or below, so the eight neighbours of every cell are the bits of
+    eight integers.
+
+    The eight neighbour bits are added with bitwise adders (SWAR: SIMD Within
+    A Register), so every cell in the grid is counted at the same time:
+
+    - The left and right neighbours give a 2-bit sum.
+    - Adding the cell itself gives a 2-bit sum (0 to 3) of three cells,
+      which is shifted to give the sums for the rows above and below.
+    - The three low bits are added to give the 'ones' bit of the count,
+      and a carry into the 'twos' bits.
+
+    A cell has 2 or 3 neighbours when exactly one of the four 'twos' bits is
+    set. The cell lives if it has 3 neighbours ('ones' set), or 2 neighbours
+    and is already alive.
+    """
+    x_origin = x_min - 1
+    y_origin = y_min - 1
+    # Whole bytes per row, with room for the margin either side.
+    row_bytes = (x_max - x_min + 10) // 8
+    row_bits = row_bytes * 8
+    # An empty row at each end for the margin.
+    rows = [0] * (y_max - y_min + 3)
+    for y, x in live_cells:
+        rows[y - y_origin] |= 1 << (x - x_origin)
+    grid = int.from_bytes(b''.join([row.to_bytes(row_bytes, 'little') for row in rows]),
+                          'little')
+    # Left + right neighbours.
+    left, right = grid << 1, grid >> 1
+    ones_row, twos_row = left ^ right, left & right
+    # Left + right neighbours + cell, for the rows above and below.
+    ones_triple, twos_triple = ones_row ^ grid, twos_row | (ones_row & grid)
+    ones_above, twos_above = ones_triple << row_bits, twos_triple << row_bits
+    ones_below, twos_below = ones_triple >> row_bits, twos_triple >> row_bits
+    # Add the 'ones' bits.
+    ones = ones_above ^ ones_row ^ ones_below
+    carry = (ones_above & ones_row) | (ones_below & (ones_above ^ ones_row))
+    # Exactly one of the four 'twos' bits is set.
+    one_two = (((twos_above ^ twos_row) ^ (twos_below ^ carry))
+               & ~((twos_above & twos_row) | (twos_below & carry)))
+    alive = one_two & (ones | grid)
+
+    # Unpack the live cells a row at a time.
+    new_cells = set()
+    data = alive.to_bytes(len(rows) * row_bytes, 'little')
+    empty_row = bytes(row_bytes)
+    y = y_origin
+    for start in range(0, len(data), row_bytes):
+        row_data = data[start:start + row_bytes]
+        if row_data != empty_row:
+            row = int.from_bytes(row_data, 'little')
+            if row.bit_count() > LUT_MIN_CELLS:
+                # Look up the set bits of each byte.
+                x = x_origin
+                for byte in row_data:
+                    if byte:
+                        for bit in BYTE_BITS[byte]:
+                            new_cells.add((y, x + bit))
+                    x += 8
+            else:
+                # Peel off the set bits one at a time.
+                while row:
+                    lowest_bit = row & -row
+                    new_cells.add((y, x_origin + lowest_bit.bit_length() - 1))
+                    row ^= lowest_bit
+        y += 1
+    return new_cells
+
+
+def horizontal_runs(cells: Iterable[Cell]) -> list[tuple[int, int, int]]:
+    """Return the horizontal runs of adjacent cells.
+
+    Parameters
+    ----------
+    cells : Iterable[Cell]
+        Coordinates (y, x) of the cells.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        (y, x, length) of each run, where (y, x) is the left end of the run.
+    """
+    runs = []
+    run_y = run_x = length = 0
+    for y, x in sorted(cells):
+        if y == run_y and x == run_x + length:
+            length += 1
+        else:
+            if length:
+                runs.append((run_y, run_x, length))
+            run_y, run_x, length = y, x, 1
+    if length:
+        runs.append((run_y, run_x, length))
+    return runs
 
 
 def play(stdscr: curses.window, choice: int, refresh_rate: float) -> None:
     """Play the Game of Life."""
     curses.curs_set(0)  # Turn off blinking cursor.
     stdscr.clear()
+    # Refresh now, as reading a key would otherwise refresh stdscr over the pad.
+    stdscr.refresh()
     # Initialise Universe instance.
     universe = Universe()
     # Initialise starting  population.
     universe.init_cells(choice)
     universe.refresh_rate = refresh_rate
     # Initialise game interface.
-    ui = GameOfLifeUI()
-    universe_old: set[Point] = set()
+    ui = GameOfLifeUI(universe)
+    universe_old: set[Cell] = set()
 
     while True:
-        # Clear old cells.
-        ui.clear_cells(universe_old)
-        # Add content to pad in reverse colours
-        ui.populate(universe.live_cells)
+        # Only cells that have changed need to be redrawn.
+        # Clear cells that have died.
+        ui.clear_cells(universe_old - universe.live_cells)
+        # Add cells that have been born, in reverse colours.
+        ui.populate(universe.live_cells - universe_old)
         # (Optional) write info to top line.
         ui.write_info()
+        # Wait until the frame is due. Stop if the user quits.
+        if ui.wait_for_frame(stdscr):
+            break
         # Render to screen.
         ui.refresh_pad()
         # Update to next generation.
@@ -272,17 +578,22 @@ def play(stdscr: curses.window, choice: int, refresh_rate: float) -> None:
         universe.live_cells = universe.update()
 
 
+@cache
 def get_all_presets() -> tuple[Preset, ...]:
-    """Return list of presets."""
-    presets: tuple[Preset, ...] = PRESETS
-    next_idx = presets[-1][0] + 1
-    rand_preset: Preset = random_preset(next_idx, DEFAULTS.universe_size)
-    return presets + (rand_preset,)
+    """Return list of presets.
+
+    The list is built once, so the random preset is the same for the whole
+    session.
+    """
+    rand_preset: Preset = random_preset(len(PRESETS), DEFAULTS.universe_size)
+    return PRESETS + (rand_preset,)
 
 
 def get_one_preset(choice: int) -> Preset:
     """Return specified preset when valid choice passed.
 
+    The random preset is only generated when it is first requested.
+
     Raises
     ------
     IndexError
@@ -291,5 +602,9 @@ def get_one_preset(choice: int) -> Preset:
     TypeError
         When choice is not an integer.
     """
-    presets = get_all_presets()
-    return presets[choice]
+    if -PRESET_COUNT <= choice < 0:
+        # Count back from the random preset, as get_all_presets()[choice] does.
+        choice += PRESET_COUNT
+    if choice == PRESET_COUNT - 1:
+        return get_all_presets()[choice]
+    return PRESETS[choice]
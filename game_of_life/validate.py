@@ -1,8 +1,13 @@
 """Validators."""
 
+from typing import Final
 
-from game_of_life.gol import get_all_presets
-from game_of_life.constants import REFRESH_RATE_RANGE
+from game_of_life.constants import PRESET_COUNT, REFRESH_RATE_RANGE
+
+
+# Refresh rate bounds, read once from REFRESH_RATE_RANGE.
+FASTEST: Final[float] = REFRESH_RATE_RANGE['min']
+SLOWEST: Final[float] = REFRESH_RATE_RANGE['max']
 
 
 def valid_refresh_rate_string(value: str) -> float:
@@ -60,11 +65,9 @@ def valid_refresh_rate(value: float) -> float:
     Validates whether the provided refresh rate value is within
     the range specified by constants.REFRESH_RATE_RANGE.
     """
-    fastest = REFRESH_RATE_RANGE['min']
-    slowest = REFRESH_RATE_RANGE['max']
-    if not fastest <= value <= slowest:
+    if not FASTEST <= value <= SLOWEST:
         raise ValueError(
-            f'Refresh rate must be between {fastest} and {slowest}.')
+            f'Refresh rate must be between {FASTEST} and {SLOWEST}.')
     return value
 
 
@@ -115,8 +118,8 @@ def valid_preset_id(value: int) -> int:
     ValueError
         If value is not a valid Preset ID.
     """
-    if value < 0 or value >= len(get_all_presets()):
+    if value < 0 or value >= PRESET_COUNT:
         raise ValueError(
-            f'{value} is not a valid preset ID.'
-            f'Select a preset from 0 to {len(get_all_presets())}')
+            f'{value} is not a valid preset ID. '
+            f'Select a preset from 0 to {PRESET_COUNT - 1}')
     return value
@@ -0,0 +1,28 @@
+"""Shared pytest configuration.
+
+Tests marked `slow` are exhaustive checks that are skipped unless
+pytest is run with `--run-slow`.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser) -> None:
+    """Add the --run-slow command-line option."""
+    parser.addoption('--run-slow', action='store_true', default=False,
+                     help='run tests marked as slow')
+
+
+def pytest_configure(config) -> None:
+    """Register the slow marker."""
+    config.addinivalue_line('markers', 'slow: exhaustive test, run with --run-slow')
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Skip tests marked slow unless --run-slow is given."""
+    if config.getoption('--run-slow'):
+        return
+    skip_slow = pytest.mark.skip(reason='needs --run-slow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
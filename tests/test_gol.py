@@ -6,6 +6,9 @@ import pytest
 
 from game_of_life.gol import (Universe,
                               GameOfLifeUI,
+                              next_generation_sparse,
+                              next_generation_packed,
+                              horizontal_runs,
                               get_all_presets,
                               get_one_preset)
 from game_of_life.custom_types import Point, Preset, Size
@@ -15,45 +18,133 @@ from game_of_life.constants import DEFAULTS, PRESETS
 # pylint: disable=W0212 [protected-access]
 
 
-@pytest.fixture(name="universe_singleton")
+@pytest.fixture(name="new_universe")
 def universe_fixture():
-    """Fixture for Universe Singleton Testing.
+    """Fixture for Universe Testing.
 
-        Sets up and provides an initialized Universe singleton instance for testing purposes.
-        The fixture yields the singleton instance, and after the test completes, it resets
-        the Universe singleton to its initial state.
+        Provides a new, empty Universe instance for testing purposes.
 
-        Yields
-        ------
+        Returns
+        -------
         Universe
-            An initialized Universe singleton instance.
+            An initialized Universe instance.
         """
-    # Setup: Initialize the Universe singleton
-    universe = Universe()
-    yield universe
-    # Teardown: Reset the Universe singleton to its initial state
-    Universe._instance = None
-    Universe._initialized = False
+    return Universe()
 
 
-def test_update(universe_singleton) -> None:
-    """Test game_of_life.gol.update()"""
-    universe = universe_singleton  # Singleton instance.
+FAR = 10_000_000
+UPDATE_CASES = [
     # Case 1: A single cell dies.
-    universe.live_cells = {Point(10, 10)}
-    assert len(universe.update()) == 0
+    ({Point(10, 10)}, set()),
     # Case 2: 3 adjacent cells in a line.
-    universe.live_cells = {Point(10, 10), Point(10, 11), Point(10, 12)}
-    expected = {Point(9, 11), Point(10, 11), Point(11, 11)}
-    assert universe.update() == expected
+    ({Point(10, 10), Point(10, 11), Point(10, 12)},
+     {Point(9, 11), Point(10, 11), Point(11, 11)}),
     # Case 3: 3 cells in "L" shape.
-    universe.live_cells = {Point(10, 10), Point(10, 11), Point(9, 10)}
-    expected = {Point(9, 11), Point(10, 10), Point(10, 11), Point(9, 10)}
-    assert universe.update() == expected
+    ({Point(10, 10), Point(10, 11), Point(9, 10)},
+     {Point(9, 11), Point(10, 10), Point(10, 11), Point(9, 10)}),
     # Case 4: Two cells above and one below.
-    universe.live_cells = {Point(0, 0), Point(0, 1), Point(2, 0)}
-    expected = {Point(1, 0), Point(1, 1)}
-    assert universe.update() == expected
+    ({Point(0, 0), Point(0, 1), Point(2, 0)},
+     {Point(1, 0), Point(1, 1)}),
+    # Case 5: Two lines of 3 cells, very far apart.
+    ({Point(10, 10), Point(10, 11), Point(10, 12),
+      Point(10, FAR), Point(10, FAR + 1), Point(10, FAR + 2)},
+     {Point(9, 11), Point(10, 11), Point(11, 11),
+      Point(9, FAR + 1), Point(10, FAR + 1), Point(11, FAR + 1)}),
+    # Case 6: A line of 20 cells.
+    ({Point(10, x) for x in range(20)},
+     {Point(y, x) for y in (9, 10, 11) for x in range(1, 19)}),
+]
+
+
+@pytest.mark.parametrize('live_cells, expected', UPDATE_CASES)
+def test_update(new_universe, live_cells, expected) -> None:
+    """Test game_of_life.gol.update()"""
+    new_universe.live_cells = live_cells
+    assert new_universe.update() == expected
+
+
+def test_update_still_life(new_universe) -> None:
+    """Test that a still life is not recalculated."""
+    universe = new_universe
+    block = {Point(7, 7), Point(8, 7), Point(7, 8), Point(8, 8)}
+    universe.live_cells = set(block)
+    # Snapshots are only kept once the population repeats, so the still life
+    # is found on the third update.
+    for _ in range(3):
+        universe.live_cells = universe.update()
+        assert universe.live_cells == block
+    with patch('game_of_life.gol.next_generation') as mock_next_generation:
+        assert universe.update() == block
+        mock_next_generation.assert_not_called()
+    # Case 2: New live cells are calculated.
+    universe.live_cells = {Point(10, 10), Point(10, 11), Point(10, 12)}
+    assert universe.update() == {Point(9, 11), Point(10, 11), Point(11, 11)}
+    # Case 3: A still life modified in place is recalculated.
+    universe.live_cells = set(block)
+    universe.live_cells = universe.update()
+    universe.live_cells = universe.update()
+    universe.live_cells.update({Point(20, 10), Point(20, 11), Point(20, 12)})
+    assert universe.update() == block | {Point(19, 11), Point(20, 11), Point(21, 11)}
+
+
+def test_update_oscillator(new_universe) -> None:
+    """Test that the generations of an oscillator are replayed, not recalculated."""
+    universe = new_universe
+    horizontal = {Point(10, 10), Point(10, 11), Point(10, 12)}
+    vertical = {Point(9, 11), Point(10, 11), Point(11, 11)}
+    universe.live_cells = set(horizontal)
+    # The cycle is found the second time the blinker returns to its first generation.
+    for expected in (vertical, horizontal, vertical, horizontal):
+        universe.live_cells = universe.update()
+        assert universe.live_cells == expected
+    with patch('game_of_life.gol.next_generation') as mock_next_generation:
+        for expected in (vertical, horizontal, vertical):
+            universe.live_cells = universe.update()
+            assert universe.live_cells == expected
+        mock_next_generation.assert_not_called()
+    # Case 2: Setting new live cells starts again.
+    universe.live_cells = set(horizontal)
+    assert universe.update() == vertical
+
+
+def test_update_oscillator_modified(new_universe) -> None:
+    """Test that changes to the cells of a detected cycle are not replayed over."""
+    universe = new_universe
+    horizontal = {Point(10, 10), Point(10, 11), Point(10, 12)}
+    vertical = {Point(9, 11), Point(10, 11), Point(11, 11)}
+    block = {Point(20, 20), Point(20, 21), Point(21, 20), Point(21, 21)}
+    universe.live_cells = set(horizontal)
+    for _ in range(3):
+        universe.live_cells = universe.update()
+    # Case 1: live_cells is modified in place after the cycle is detected.
+    assert universe.live_cells == vertical
+    universe.live_cells.update(block)
+    assert universe.update() == horizontal | block
+    # Case 2: Modifying an earlier generation does not corrupt the replay.
+    universe.live_cells = set(horizontal)
+    for _ in range(3):
+        universe.live_cells = universe.update()
+    earlier = universe.live_cells
+    universe.live_cells = universe.update()
+    earlier.clear()
+    universe.live_cells = universe.update()
+    assert universe.live_cells == vertical
+
+
+@pytest.mark.parametrize('offset', [(0, 0), (-20, -60)])
+@pytest.mark.parametrize('preset', PRESETS, ids=lambda preset: preset.name)
+def test_next_generation_sparse_and_packed(preset, offset) -> None:
+    """Test that the sparse and packed updates agree."""
+    dy, dx = offset
+    live_cells = {(y + dy, x + dx) for y, x in preset.cells}
+    for _ in range(20):
+        y_min = min(live_cells)[0]
+        y_max = max(live_cells)[0]
+        x_min = min(x for _, x in live_cells)
+        x_max = max(x for _, x in live_cells)
+        sparse = next_generation_sparse(live_cells)
+        assert next_generation_packed(live_cells, y_min, y_max, x_min, x_max) == sparse
+        live_cells = sparse
 
 
 def test_get_preset() -> None:
@@ -70,41 +161,41 @@ def test_get_preset() -> None:
 
 # Universe Tests
 
-def test_singleton(universe_singleton) -> None:
-    """Test that Universe is singleton."""
-    u1 = universe_singleton
-    u2 = universe_singleton
-    assert u1 is u2
+def test_universe_instances(new_universe) -> None:
+    """Test that each Universe has its own state."""
+    u1 = new_universe
+    u2 = Universe()
+    assert u1 is not u2
+    u1.live_cells.add(Point(1, 1))
+    assert not u2.live_cells
 
 
 @pytest.mark.parametrize('attribute, expected_type', [
-    ('_initialized', bool),
     ('display_size', Size),
     ('_refresh_rate', float),
     ('live_cells', set)])
-def test_universe_attribute_types(universe_singleton, attribute, expected_type) -> None:
+def test_universe_attribute_types(new_universe, attribute, expected_type) -> None:
     """Test Universe attribute types."""
-    universe = universe_singleton
+    universe = new_universe
     attr = getattr(universe, attribute)
     assert isinstance(attr, expected_type)
 
 
 @pytest.mark.parametrize('attribute, expected_val', [
-    ('_initialized', True),
     ('display_size', DEFAULTS.universe_size),
     ('_refresh_rate', DEFAULTS.refresh_rate),
     ('live_cells', set()),
 ])
-def test_universe_attribute_values(universe_singleton, attribute, expected_val):
+def test_universe_attribute_values(new_universe, attribute, expected_val):
     """Test Universe attribute values."""
-    universe = universe_singleton
+    universe = new_universe
     attr = getattr(universe, attribute)
     assert attr == expected_val
 
 
-def test_init_cells(universe_singleton):
+def test_init_cells(new_universe):
     """Test Universe.init_cells."""
-    universe = universe_singleton
+    universe = new_universe
     mock_presets = [Preset(0, 'first', {Point(0, 0), Point(1, 1)}),
                     Preset(1, 'second', {Point(0, 0)})]
     def mock_get_one_preset(choice):
@@ -144,10 +235,10 @@ def test_init_cells(universe_singleton):
         assert universe.live_cells == previous_state
 
 
-def test_refresh_rate(universe_singleton) -> None:
+def test_refresh_rate(new_universe) -> None:
     """Test Universe.refresh_rate."""
     default_rate = DEFAULTS.refresh_rate
-    universe = universe_singleton
+    universe = new_universe
     # Case 1: Default value
     assert universe.refresh_rate == default_rate
     # Case 2: Set refresh rate.
@@ -164,14 +255,14 @@ def test_refresh_rate(universe_singleton) -> None:
     ('_cell_char', str),
     ('_refresh_rate', float),
     ('_population', int),
-    ('_clock', float),
+    ('_next_frame', float),
 ])
 @patch('curses.newpad')  # Patch the curses.newpad function.
 def test_gameoflifeui_attribute_types(mock_newpad, attribute, expected_type) -> None:
     """Test GameOfLifeUI attribute types."""
     mock_curses_window = Mock(name='curses._CursesWindow')
     mock_newpad.return_value = mock_curses_window
-    gol = GameOfLifeUI()
+    gol = GameOfLifeUI(Universe())
     # Iterate through attributes and test types
     attr = getattr(gol, attribute)
     if attr == gol._pad:
@@ -181,13 +272,13 @@ def test_gameoflifeui_attribute_types(mock_newpad, attribute, expected_type) ->
 
 
 @patch('curses.newpad')  # Patch the curses.newpad function
-def test_gameoflifeui_init(mock_newpad, universe_singleton):
+def test_gameoflifeui_init(mock_newpad, new_universe):
     """Test GameOfLifeUI attribute values."""
     mock_curses_window = Mock(name='curses._CursesWindow')
     mock_newpad.return_value = mock_curses_window
-    universe = universe_singleton
+    universe = new_universe
     # Create the GameOfLifeUI instance
-    golui = GameOfLifeUI()
+    golui = GameOfLifeUI(universe)
 
     # Assertions for attribute initialization
     assert golui._universe is universe
@@ -196,7 +287,7 @@ def test_gameoflifeui_init(mock_newpad, universe_singleton):
     assert golui._cell_char == ' '
     assert golui._refresh_rate == universe.refresh_rate
     assert golui._population == 0
-    assert isinstance(golui._clock, float)
+    assert isinstance(golui._next_frame, float)
 
 
 @pytest.fixture(name="mock_game_of_life_ui")
@@ -219,6 +310,58 @@ def test_gameoflifeui_pad_size(mock_game_of_life_ui):
     assert mock_game_of_life_ui.pad_size == Size(y=50, x=100)
 
 
+@pytest.mark.parametrize('cols', [100, 60])
+@patch('curses.newpad')
+def test_gameoflifeui_write_info(mock_newpad, cols) -> None:
+    """Test GameOfLifeUI.write_info writes the whole info line at once."""
+    mock_pad = Mock(name='curses._CursesWindow')
+    mock_newpad.return_value = mock_pad
+    golui = GameOfLifeUI(Universe())
+    with (patch('curses.LINES', 30, create=True),
+          patch('curses.COLS', cols, create=True)):
+        golui.write_info()
+        # Nothing has changed, so the line is not written again.
+        golui.write_info()
+    mock_pad.addstr.assert_called_once()
+    _, _, line, _ = mock_pad.addstr.call_args.args
+    # The line fills the pad width, so it does not wrap onto the next line.
+    assert len(line) == golui.pad_size.x
+    assert line.startswith('Population: 0 ')
+    # Window info is right aligned to the visible part of the pad.
+    visible_line = line[:min(cols, golui.pad_size.x)]
+    assert visible_line.endswith(f' Height: 30 Width: {cols} ')
+
+
+@pytest.mark.parametrize('keys, expected', [
+    ([-1], False),  # Timed out without a key press.
+    ([ord('x'), -1], False),  # Other keys are ignored.
+    ([ord('q')], True),
+    ([ord('x'), ord('Q')], True),
+])
+@patch('curses.newpad')
+def test_gameoflifeui_wait_for_frame(_mock_newpad, keys, expected) -> None:
+    """Test GameOfLifeUI.wait_for_frame returns True when a quit key is pressed."""
+    window = Mock(name='curses.window')
+    window.getch.side_effect = keys
+    golui = GameOfLifeUI(Universe())
+    assert golui.wait_for_frame(window) is expected
+    assert window.getch.call_count == len(keys)
+
+
+@pytest.mark.parametrize('cells, expected', [
+    (set(), []),
+    ({Point(3, 4)}, [(3, 4, 1)]),
+    ({Point(3, 4), Point(3, 5), Point(3, 6)}, [(3, 4, 3)]),
+    ({Point(3, 4), Point(3, 6), Point(2, 5), Point(4, 5)},
+     [(2, 5, 1), (3, 4, 1), (3, 6, 1), (4, 5, 1)]),
+    ({Point(0, 79), Point(1, 0), Point(1, 1)}, [(0, 79, 1), (1, 0, 2)]),
+    ({Point(-1, -2), Point(-1, -1), Point(-1, 0)}, [(-1, -2, 3)]),
+])
+def test_horizontal_runs(cells, expected) -> None:
+    """Test game_of_life.gol.horizontal_runs."""
+    assert horizontal_runs(cells) == expected
+
+
 @pytest.mark.timeout(0.5)  # Ensure we don't get stuck in loop.
 def test_gol_get_one_preset() -> None:
     """Test gol.get_one_preset.
@@ -248,3 +391,22 @@ def test_gol_get_one_preset() -> None:
             assert preset_count == expected_number_of_presets
             break  # Exit test.
         index += 1
+
+
+def test_gol_get_one_preset_random() -> None:
+    """Test that the random preset is the same for the whole session."""
+    random_id = len(PRESETS)
+    assert get_one_preset(random_id) is get_all_presets()[random_id]
+    assert get_one_preset(random_id) is get_one_preset(random_id)
+
+
+@pytest.mark.parametrize('choice', range(-len(PRESETS) - 1, 0))
+def test_gol_get_one_preset_negative(choice) -> None:
+    """Test that negative choices count back from the random preset."""
+    assert get_one_preset(choice) is get_all_presets()[choice]
+
+
+def test_gol_get_one_preset_too_negative() -> None:
+    """Test that choices before the first preset raise IndexError."""
+    with pytest.raises(IndexError):
+        get_one_preset(-len(PRESETS) - 2)
@@ -1,6 +1,6 @@
 """Tests for menu.py"""
 
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 import pytest
 
 from game_of_life.custom_types import Preset
@@ -11,25 +11,39 @@ from game_of_life.menu import (preset_menu,
 from game_of_life.custom_types import Defaults, Size
 
 
+@pytest.fixture(name="mock_user_choice")
+def mock_user_choice_fixture(monkeypatch):
+    """Replace menu.get_user_preset_choice with a Mock."""
+    mock_choice = Mock()
+    monkeypatch.setattr('game_of_life.menu.get_user_preset_choice', mock_choice)
+    return mock_choice
+
+
+@pytest.fixture(name="silent_print")
+def silent_print_fixture(monkeypatch):
+    """Suppress printing."""
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+
+
 @pytest.mark.parametrize(
     "test_settings,expected_output", [
         # Empty list of Presets will print nothing.
         ([], ''),
         # List of one preset
-        ([Preset(0, 'Preset name', set())], '0. Preset name'),
+        ([Preset(0, 'Preset name', frozenset())], '0. Preset name'),
         # Multiple presets
-        ([Preset(0, 'First', set()),
-          Preset(1, 'Second', set()),
-          Preset(2, 'Third', set())],
+        ([Preset(0, 'First', frozenset()),
+          Preset(1, 'Second', frozenset()),
+          Preset(2, 'Third', frozenset())],
          '0. First\n1. Second\n2. Third')])
+@pytest.mark.usefixtures('mock_user_choice')
 def test_preset_menu_with_fixture(capsys, test_settings, expected_output) -> None:
     """Test menu.preset_menu with  fixtures.
 
     This only tests the printed menu. The return value is ignored
     and will be tested separately.
     """
-    with (patch('game_of_life.menu.get_all_presets') as mock_get_all_presets,
-          patch('game_of_life.menu.get_user_preset_choice')):
+    with patch('game_of_life.menu.get_all_presets') as mock_get_all_presets:
         mock_get_all_presets.return_value = test_settings
         preset_menu()
         captured = capsys.readouterr()
@@ -37,16 +51,16 @@ def test_preset_menu_with_fixture(capsys, test_settings, expected_output) -> Non
         assert captured.out.strip() == expected_output
 
 
-def test_preset_menu_return() -> None:
+# Values from 0 to an arbitrary number > number of presets.
+@pytest.mark.parametrize('val', [0, 1, 7, 42, 99])
+@pytest.mark.usefixtures('silent_print')  # No need to print.
+def test_preset_menu_return(mock_user_choice, val) -> None:
     """Check return values from menu.preset_menu."""
-    with (patch('game_of_life.menu.get_user_preset_choice') as mock_user_choice,
-          patch('builtins.print')):  # No need to print.
-        # Test values from 0 to an arbitrary number > number of presets.
-        for val in range(100):
-            mock_user_choice.return_value = val
-            assert preset_menu() == mock_user_choice.return_value
+    mock_user_choice.return_value = val
+    assert preset_menu() == val
 
 
+@pytest.mark.usefixtures('mock_user_choice')
 def test_preset_menu_with_presets(capsys) -> None:
     """Test menu display with actual Presets.
 
@@ -62,23 +76,39 @@ def test_preset_menu_with_presets(capsys) -> None:
     -----
     This only tests the printed menu. The return value is ignored
     """
-    with patch('game_of_life.menu.get_user_preset_choice') as _:
-        preset_menu()
-        captured = capsys.readouterr()
-        # Check 1: no error strings.
-        assert captured.err == ''
-        # Check 2: Correctly formatted strings
-        assert captured.out != ''
-        out = captured.out.strip()
-        for line in out.split('\n'):
-            assert len(line.split()) == 2  # Example ['2.', 'Beacon']
-            idx_str, _ = line.split(' ', 1)
-            assert idx_str[:-1].isnumeric()
-            assert idx_str[-1] == '.'
-            assert line[-1] != ''  # Not an empty  string.
-
-
-def test_user_preset_choice(capsys) -> None:
+    preset_menu()
+    captured = capsys.readouterr()
+    # Check 1: no error strings.
+    assert captured.err == ''
+    # Check 2: Correctly formatted strings
+    assert captured.out != ''
+    out = captured.out.strip()
+    for line in out.split('\n'):
+        assert len(line.split()) == 2  # Example ['2.', 'Beacon']
+        idx_str, _ = line.split(' ', 1)
+        assert idx_str[:-1].isnumeric()
+        assert idx_str[-1] == '.'
+        assert line[-1] != ''  # Not an empty  string.
+
+
+TEST_PRESETS = (Preset(0, 'First', frozenset()),
+                Preset(1, 'Second', frozenset()))
+TEST_DEFAULTS = Defaults(universe_size=Size(0, 0), preset=0, refresh_rate=0.5)
+RANGE_ERROR = 'Invalid choice. Please try again.'
+TYPE_ERROR = 'Invalid input. Please enter a number.'
+NO_ERROR = ''
+
+
+@pytest.mark.parametrize('inputs, errors, rtn', [
+    ([''], [NO_ERROR], TEST_DEFAULTS.preset),  # Default.
+    (['0'], [NO_ERROR], 0),  # Valid input.
+    (['1'], [NO_ERROR], 1),  # Valid input.
+    (['20', ''], [RANGE_ERROR], TEST_DEFAULTS.preset),  # Out of range.
+    (['1.5', ''], [TYPE_ERROR], TEST_DEFAULTS.preset),  # Non-integer.
+    (['not a number', ''], [TYPE_ERROR], TEST_DEFAULTS.preset),  # Non-numeric.
+    (['w', '-6', '20', '1.5', '1'], [TYPE_ERROR, RANGE_ERROR], 1),  # Multiple errors.
+])
+def test_user_preset_choice(capsys, monkeypatch, inputs, errors, rtn) -> None:
     """Test menu.get_user_preset_choice.
 
     Notes
@@ -92,49 +122,31 @@ def test_user_preset_choice(capsys) -> None:
 
     A valid input is an integer-string that matches a Preset ID.
     """
-    mock_get_all_presets = [Preset(0, 'First', set()),
-                            Preset(1, 'Second', set())]
-
-    defaults = Defaults(universe_size=Size(0, 0), preset=0, refresh_rate=0.5)
-    range_error = 'Invalid choice. Please try again.'
-    type_error = 'Invalid input. Please enter a number.'
-    no_error = ''
-
-    test_cases = [  # ('input', 'error')
-        ([''], [no_error], defaults.preset),  # Default.
-        (['0'], [no_error], 0),  # Valid input.
-        (['1'], [no_error], 1),  # Valid input.
-        (['20', ''], [range_error], defaults.preset),  # Out of range.
-        (['1.5', ''], [type_error], defaults.preset),  # Non-integer.
-        (['not a number', ''], [type_error], defaults.preset),  # Non-numeric.
-        (['w', '-6', '20', '1.5', '1'], [type_error, range_error], 1),  # Multiple errors.
-    ]
-    for inputs, errors, rtn in test_cases:
-        with (patch('builtins.input', side_effect=inputs),
-              patch('game_of_life.menu.get_all_presets', return_value=mock_get_all_presets),
-              patch('game_of_life.menu.DEFAULTS', new=defaults)):
-            val = get_user_preset_choice()
-            captured = capsys.readouterr()
-            if len(errors) == 1:  # A single error
-                assert errors[0] == captured.out.strip()
-            else:
-                for err in errors:
-                    assert err in captured.out
-            assert val == rtn
-
-
-def test_refresh_rate_menu() -> None:
+    monkeypatch.setattr('game_of_life.menu.get_all_presets', lambda: TEST_PRESETS)
+    monkeypatch.setattr('game_of_life.menu.DEFAULTS', TEST_DEFAULTS)
+    with patch('builtins.input', side_effect=inputs):
+        val = get_user_preset_choice()
+    captured = capsys.readouterr()
+    if len(errors) == 1:  # A single error
+        assert errors[0] == captured.out.strip()
+    else:
+        for err in errors:
+            assert err in captured.out
+    assert val == rtn
+
+
+def test_refresh_rate_menu(monkeypatch) -> None:
     """Test menu.refresh_rate_menu.
 
     This only tests that the supplied input is returned.
     """
-    with (patch('game_of_life.menu.REFRESH_RATE_RANGE', new={'min': 0, 'max': 10}),
-          patch('game_of_life.menu.get_user_refresh_rate') as mock_user_refresh_rate):
+    monkeypatch.setattr('game_of_life.menu.REFRESH_RATE_RANGE', {'min': 0, 'max': 10})
+    with patch('game_of_life.menu.get_user_refresh_rate') as mock_user_refresh_rate:
         mock_user_refresh_rate.return_value = 1
         assert refresh_rate_menu() == mock_user_refresh_rate.return_value
 
 
-def test_user_refresh_rate(capsys) -> None:
+def test_user_refresh_rate(capsys, monkeypatch) -> None:
     """Test menu.get_user_refresh_rate.
 
     Notes
@@ -150,34 +162,27 @@ def test_user_refresh_rate(capsys) -> None:
     """
     refresh_rate_range = {'min': 0, 'max': 10}
 
-    def side_effects():
-        """User input values.
-
-        Only the final value is valid.
-        """
-        input_vals = [
-            refresh_rate_range['min'] - 1,
-            refresh_rate_range['min'] - 1.1,
-            refresh_rate_range['max'] + 1,
-            refresh_rate_range['max'] + 1.1,
-            'not a number',
-            (refresh_rate_range['min'] + refresh_rate_range['max']) / 2.0
-        ]
-        for value in input_vals:
-            yield str(value)
-
-    with (patch('builtins.input', side_effect=side_effects()),
-          patch('game_of_life.menu.REFRESH_RATE_RANGE', new=refresh_rate_range)):
+    # User input values. Only the final value is valid.
+    input_vals = [
+        refresh_rate_range['min'] - 1,
+        refresh_rate_range['min'] - 1.1,
+        refresh_rate_range['max'] + 1,
+        refresh_rate_range['max'] + 1.1,
+        'not a number',
+        (refresh_rate_range['min'] + refresh_rate_range['max']) / 2.0
+    ]
+
+    monkeypatch.setattr('game_of_life.menu.REFRESH_RATE_RANGE', refresh_rate_range)
+    with patch('builtins.input', side_effect=[str(value) for value in input_vals]):
         val = get_user_refresh_rate()
         # Invalid input should cause user prompts to be printed.
         captured = capsys.readouterr()
         assert captured.out
         assert val == (refresh_rate_range['min'] + refresh_rate_range['max']) / 2.0
     # Check that an empty string returns the default without error.
-    defaults = Defaults(universe_size=Size(0, 0), preset=0, refresh_rate=0.5)
-    with (patch('builtins.input', return_value=''),
-          patch('game_of_life.menu.DEFAULTS', new=defaults)):
-        val = get_user_refresh_rate()
-        captured = capsys.readouterr()
-        assert captured.out == ''
-        assert val == defaults.refresh_rate
+    monkeypatch.setattr('builtins.input', lambda *args: '')
+    monkeypatch.setattr('game_of_life.menu.DEFAULTS', TEST_DEFAULTS)
+    val = get_user_refresh_rate()
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert val == TEST_DEFAULTS.refresh_rate
@@ -7,7 +7,7 @@ Each preset in PRESETS must:
 - Be a valid Preset type.
 - Have a unique idx, as a sequence of consecutive integers.
 - Have a non-empty name (str).
-- Have at least one cell.
+- Have at least one cell, in a frozenset.
 """
 
 from game_of_life.constants import PRESETS
@@ -28,7 +28,7 @@ def test_preset_data() -> None:
         assert val == preset.idx
         # preset.name must be non-empty string.
         assert isinstance(preset.name, str) and bool(preset.name)
-        # preset.cells must be a non-empty set of cells.
-        assert isinstance(preset.cells, set) and bool(preset.cells)
+        # preset.cells must be a non-empty frozenset of cells.
+        assert isinstance(preset.cells, frozenset) and bool(preset.cells)
         for cell in preset.cells:
             assert isinstance(cell, Point)
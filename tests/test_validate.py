@@ -9,9 +9,9 @@ from game_of_life.gol import get_all_presets
 
 def test_valid_preset_id() -> None:
     """Test __main__.valid_preset."""
-    valid_indices = range(len(get_all_presets()))
+    preset_count = len(get_all_presets())
     # Case 1: Valid presets.
-    for idx in valid_indices:
+    for idx in range(preset_count):
         assert valid_preset_id_string(f'{idx}') == idx
     # Case 2: Invalid preset IDs below 0.
     with pytest.raises(ValueError) as exc_info:
@@ -19,7 +19,7 @@ def test_valid_preset_id() -> None:
     assert "is not a valid preset ID" in str(exc_info.value)
     # Case 3: Invalid preset IDs above maximum index.
     with pytest.raises(ValueError) as exc_info:
-        valid_preset_id_string(str(len(get_all_presets()) + 1))
+        valid_preset_id_string(str(preset_count + 1))
     assert "is not a valid preset ID" in str(exc_info.value)
     # Case 4: Non-integer input
     with pytest.raises(ValueError) as exc_info:
@@ -27,28 +27,35 @@ def test_valid_preset_id() -> None:
     assert "not_an_integer" in str(exc_info.value)
 
 
-def test_valid_refresh_rate() -> None:
+@pytest.mark.parametrize('value, expected', [
+    ('0.0', 0.0), ('0.1', 0.1), ('1.0', 1.0), ('9.9', 9.9), ('10.0', 10.0)])
+def test_valid_refresh_rate(value, expected) -> None:
     """Test __main__.valid_refresh_rate.
 
     Refresh rate is fastest when waiting before refresh is zero (disabled).
-    `slowest` is fairly arbitrary, but should match __main__.valid_refresh_rate().
+    The slowest rate, 10 seconds, is fairly arbitrary, but should match
+    constants.REFRESH_RATE_RANGE.
     """
-    fastest = 0
-    slowest = 10
-    # Case 1: Valid values.
-    delta = 1e-9
-    for val in range(fastest, 10 * slowest):
-        float_val = val / 10.0
-        # Being cautious about float precision, though probably not necessary.
-        assert valid_refresh_rate_string(f'{float_val}') - float_val < delta
-    # Case 2: Out of range values.
-    with pytest.raises(ValueError) as exc_info:
-        valid_refresh_rate_string(f'{fastest - 0.01}')
-    assert 'Refresh rate must be between' in str(exc_info.value)
-    with pytest.raises(ValueError) as exc_info:
-        valid_refresh_rate_string(f'{slowest + 0.01}')
-    assert 'Refresh rate must be between' in str(exc_info.value)
-    # Case 3: Non-number input
+    assert valid_refresh_rate_string(value) == expected
+
+
+# Every tenth of a second from 0 to 10, formatted once at import.
+REFRESH_RATE_SWEEP = [(f'{val / 10.0}', val / 10.0) for val in range(101)]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('value, expected', REFRESH_RATE_SWEEP)
+def test_valid_refresh_rate_sweep(value, expected) -> None:
+    """Test __main__.valid_refresh_rate across the whole valid range."""
+    assert valid_refresh_rate_string(value) == expected
+
+
+@pytest.mark.parametrize('value, message', [
+    ('-0.01', 'Refresh rate must be between'),
+    ('10.01', 'Refresh rate must be between'),
+    ('not a number', 'not a number')])
+def test_valid_refresh_rate_invalid(value, message) -> None:
+    """Test __main__.valid_refresh_rate with out of range and non-number input."""
     with pytest.raises(ValueError) as exc_info:
-        valid_refresh_rate_string('not a number')
-    assert 'not a number' in str(exc_info.value)
+        valid_refresh_rate_string(value)
+    assert message in str(exc_info.value)